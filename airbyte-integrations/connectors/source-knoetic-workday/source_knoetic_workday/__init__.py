@@ -0,0 +1,7 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from .source import SourceKnoeticWorkday
+
+__all__ = ["SourceKnoeticWorkday"]
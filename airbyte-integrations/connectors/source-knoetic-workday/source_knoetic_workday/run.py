@@ -0,0 +1,20 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+
+import sys
+
+from airbyte_cdk.connector import BaseConnector
+from airbyte_cdk.entrypoint import AirbyteEntrypoint, launch
+from source_knoetic_workday import SourceKnoeticWorkday
+
+
+def run():
+    args = sys.argv[1:]
+    # The concurrency level is a constructor argument, so the config has to be
+    # parsed before the source is built; launch() re-reads it for the command itself.
+    config_path = AirbyteEntrypoint.extract_config(args)
+    config = BaseConnector.read_config(config_path) if config_path else None
+    source = SourceKnoeticWorkday(config)
+    launch(source, args)
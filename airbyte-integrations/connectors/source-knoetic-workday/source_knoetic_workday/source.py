@@ -0,0 +1,899 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+import io
+import logging
+import re
+from abc import ABC
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.call_rate import APIBudget, HttpRequestMatcher, LimiterSession, MovingWindowCallRatePolicy, Rate
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.sources.streams.concurrent.cursor import NoopCursor
+from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
+
+from source_knoetic_workday.workday_request import WorkdayRequest
+
+logger = logging.getLogger("airbyte")
+
+_DEFAULT_CONCURRENCY = 10
+_MAX_CONCURRENCY = 20
+
+# Pagination counters are simple numeric text elements, so a compiled bytes scan can
+# usually pick them out without invoking an XML parser at all.
+_PAGE_COUNTERS_RE = re.compile(rb"<(?:\w+:)?(Page|Total_Pages)>(\d+)<")
+
+_WD_NS = {"wd": "urn:com.workday/bsvc"}
+
+# Clark-notation tags for the pagination counters, resolved once at import.
+_PAGE_TAG = "{urn:com.workday/bsvc}Page"
+_TOTAL_PAGES_TAG = "{urn:com.workday/bsvc}Total_Pages"
+
+# Compiled once; lxml re-parses the XPath text on every find/findall otherwise.
+_XP_TOTAL_RESULTS = etree.XPath("string(.//wd:Total_Results)", namespaces=_WD_NS)
+
+# Reference subcategory types served by the Integrations web service; shared by every
+# References instance instead of being rebuilt per constructor call.
+_REFERENCE_TYPES = (
+    "Contingent_Worker_Type_ID",
+    "Employee_Type_ID",
+    "Ethnicity_ID",
+    "Event_Classification_Subcategory_ID",
+    "Gender_Code",
+    "Job_Category_ID",
+    "Job_Level_ID",
+    "Marital_Status_ID",
+    "Military_Status_ID",
+    "Organization_Type_ID",
+    "Position_Time_Type_ID",
+    "Work_Shift_ID",
+)
+
+
+def _worker_wid(worker: Mapping[str, Any]) -> Optional[str]:
+    """Return the worker's WID from its ``Worker_Reference`` ID list, if present."""
+    references = worker.get("Worker_Reference", {}).get("ID", [])
+    if isinstance(references, Mapping):
+        # element_to_dict collapses a lone ID element into a single dict.
+        return references.get("#content") if references.get("-type") == "WID" else None
+    for ref in references:
+        if ref.get("-type") == "WID":
+            return ref.get("#content")
+    return None
+
+
+# Workday throttles per tenant; with the concurrent substreams in play the connector
+# paces itself below that ceiling instead of burning requests on 429 responses that
+# would only be retried. The window is deliberately conservative for shared tenants.
+_CALLS_PER_MINUTE = 300
+
+
+def _build_api_budget() -> APIBudget:
+    policy = MovingWindowCallRatePolicy(
+        rates=[Rate(limit=_CALLS_PER_MINUTE, interval=timedelta(minutes=1))],
+        matchers=[HttpRequestMatcher()],
+    )
+    return APIBudget(policies=[policy])
+
+
+_API_BUDGET = _build_api_budget()
+
+
+def _build_shared_session() -> requests.Session:
+    """
+    All streams talk to the same Workday host, so they share one session: the
+    TCP+TLS handshake is paid once per pooled connection instead of once per stream,
+    and keep-alive connections are reused across streams and slices. The session is
+    a ``LimiterSession`` so every request — from any stream or worker thread — is
+    paced by the shared call-rate budget.
+    """
+    session = LimiterSession(api_budget=_API_BUDGET)
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_shared_session()
+
+
+class KnoeticWorkdayStream(HttpStream, ABC):
+    """
+    Base class for all Workday SOAP streams. Each stream posts an XML body (built by
+    ``WorkdayRequest`` from a per-stream template file) to the tenant's web service
+    endpoint and parses the SOAP envelope in the response into record dicts.
+    """
+
+    http_method = "POST"
+
+    def __init__(
+        self,
+        url: str,
+        tenant: str,
+        username: str,
+        password: str,
+        workday_request: WorkdayRequest,
+        web_service: str = "Human_Resources",
+        file_name: str = None,
+        stream_name: str = None,
+        per_page: int = 200,
+        page: int = 1,
+    ):
+        super().__init__(api_budget=_API_BUDGET)
+        self.url = url
+        self.tenant = tenant
+        self.username = username
+        self.password = password
+        self.workday_request = workday_request
+        self.web_service = web_service
+        self.file_name = file_name
+        self.stream_name = stream_name
+        self.per_page = per_page
+        self.page = page
+        self.api_version = "37.2"
+        self._url_base = url
+        self._path = f"{tenant}/{web_service}/{self.api_version}"
+
+        # HttpStream.__init__ builds (and re-mounts adapters on) a per-stream session;
+        # swap in the shared rate-limited one after the fact so its tuned pool survives.
+        self._session = _SHARED_SESSION
+
+        # Sync-invariant body-builder arguments; only the page (and, per subclass,
+        # things like the cursor or reference type) change between requests.
+        self._body_args = {
+            "file_name": file_name,
+            "tenant": tenant,
+            "username": username,
+            "password": password,
+            "per_page": per_page,
+        }
+
+        # Headers are identical for every request this stream makes; build the dict
+        # once instead of allocating a fresh one per paginated call.
+        # Accept-Encoding is advertised explicitly: Workday SOAP payloads are highly
+        # repetitive XML that compresses 5-10x, and requests decompresses in C.
+        self._headers = {
+            "Content-Type": "text/xml; charset=utf-8",
+            "SOAPAction": "",
+            "Accept-Encoding": "gzip, deflate",
+        }
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(
+        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> str:
+        return self._path
+
+    def request_headers(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        return self._headers
+
+    def request_kwargs(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        # Stream the response body so parsing can start while bytes are still
+        # arriving instead of waiting for the whole envelope to download.
+        return {"stream": True}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        # parse_response consumes the body straight off the socket and records the
+        # pagination counters as it passes them; fall back to scanning the buffered
+        # content only when the response was not parsed that way.
+        counters = getattr(response, "workday_page_counters", None)
+        if counters is not None:
+            current_page, total_pages = counters.get("Page"), counters.get("Total_Pages")
+        else:
+            current_page, total_pages = self._extract_page_counters(response.content)
+        if current_page is None or total_pages is None:
+            return None
+        if current_page < total_pages:
+            return {"page": current_page + 1}
+        return None
+
+    @staticmethod
+    def _extract_page_counters(content: bytes) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Pull ``Page`` and ``Total_Pages`` out of a SOAP envelope. The compiled regex
+        scan covers the counters Workday actually emits (bare numeric text elements)
+        without parsing any XML; the iterparse fallback handles envelopes where the
+        scan does not find both values.
+        """
+        # Single-page responses are the overwhelmingly common case for the lookup
+        # streams; a plain substring check answers those without running the regex.
+        if b"<wd:Total_Pages>1<" in content:
+            return 1, 1
+
+        current_page = total_pages = None
+        for match in _PAGE_COUNTERS_RE.finditer(content):
+            if match.group(1) == b"Page":
+                current_page = int(match.group(2))
+            else:
+                total_pages = int(match.group(2))
+            if current_page is not None and total_pages is not None:
+                return current_page, total_pages
+
+        # Response_Results sits at the top of the envelope, so iterparse reads the two
+        # counters and stops without building a tree for the (much larger)
+        # Response_Data that follows.
+        for _, element in etree.iterparse(io.BytesIO(content), tag=(_PAGE_TAG, _TOTAL_PAGES_TAG)):
+            if element.tag == _PAGE_TAG:
+                current_page = int(element.text)
+            else:
+                total_pages = int(element.text)
+            element.clear()
+            if current_page is not None and total_pages is not None:
+                break
+        return current_page, total_pages
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        page = next_page_token["page"] if next_page_token else self.page
+        return self.workday_request.construct_paged_request_body(page=page, **self._body_args)
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from self.workday_request.parse_response(response, stream_name=self.stream_name)
+
+
+class IncrementalKnoeticWorkdayStream(KnoeticWorkdayStream, ABC):
+    """
+    Base class for Workday streams that track a ``Last_Modified``-style cursor.
+    """
+
+    state_checkpoint_interval = 1000
+    _INCOMING_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+    def __init__(self, cursor_field: str = "Last_Modified", **kwargs):
+        super().__init__(**kwargs)
+        self._cursor_field = cursor_field
+
+    @property
+    def cursor_field(self) -> str:
+        return self._cursor_field
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        # The cursor stays the raw zero-padded ISO-8601 string Workday sends, which
+        # compares correctly as text. No datetime parsing happens per record, and the
+        # stored state is the same shape as the record value.
+        current = current_stream_state.get(self._cursor_field) or ""
+        if isinstance(current, (int, float)):
+            # State written by older connector versions stored an epoch timestamp.
+            current = datetime.utcfromtimestamp(current).strftime(self._INCOMING_DATETIME_FORMAT)
+        latest = self._record_cursor_value(latest_record)
+        return {self._cursor_field: latest if latest > current else current}
+
+    def _record_cursor_value(self, latest_record: Mapping[str, Any]) -> str:
+        """Extract the cursor from a record; override where the parser nests it."""
+        return latest_record.get(self._cursor_field) or ""
+
+
+class Workers(IncrementalKnoeticWorkdayStream):
+    primary_key = None
+
+    def __init__(self, **kwargs):
+        super().__init__(file_name="workers.xml", stream_name="workers", **kwargs)
+        self._checkpoint_page = self.page
+        self._checkpoint_record_index = 0
+        self._checkpoint_updated_from = None
+        self._final_page = None
+        self._latest_checkpoint = None
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        # Pages are enumerated up front in stream_slices, so each slice is exactly
+        # one request and slices can run independently of each other.
+        return None
+
+    def stream_slices(
+        self, sync_mode: SyncMode = None, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        # The Updated_From filter is resolved once and pinned into every slice. The
+        # cursor in stream_state advances while records are emitted, so a filter
+        # re-derived per request would aim each page at a different, shrinking result
+        # set — and at a set the probed page count below never described.
+        state = stream_state or {}
+        if "updated_from" in state:
+            # An earlier attempt checkpointed mid-sync. Keep its filter — not one
+            # derived from the since-advanced cursor — and start at its page, so the
+            # page numbers and in-page record index still address the result set the
+            # checkpoint was taken against.
+            updated_from = state["updated_from"]
+            first_page = state.get("page", 1)
+        else:
+            updated_from = self._state_to_datetime(state)
+            first_page = 1
+        total_pages = self._probe_total_pages(updated_from)
+        self._final_page = total_pages
+        return [{"page": page, "updated_from": updated_from} for page in range(first_page, total_pages + 1)]
+
+    def _probe_total_pages(self, updated_from: Optional[str] = None) -> int:
+        """
+        Issue a count-only Get_Workers request and derive the number of pages the
+        sync will need from ``Response_Results/Total_Results``. The probe template
+        carries no Response_Group, so the tenant returns just the result counts
+        rather than a full worker payload that would be discarded.
+        """
+        body = self.workday_request.construct_request_body(
+            file_name="workers_count.xml",
+            tenant=self.tenant,
+            username=self.username,
+            password=self.password,
+            page=1,
+            per_page=1,
+            last_modified=updated_from,
+        )
+        response = self._session.post(f"{self.url_base}{self.path()}", data=body, headers=dict(self._headers))
+        response.raise_for_status()
+
+        total_results = _XP_TOTAL_RESULTS(etree.fromstring(response.content))
+        if not total_results:
+            return 1
+        return max(1, -(-int(total_results) // self.per_page))
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        if stream_slice:
+            page = stream_slice["page"]
+        elif next_page_token:
+            page = next_page_token["page"]
+        else:
+            page = self.page
+        return self.workday_request.construct_paged_request_body(
+            page=page, last_modified=self._slice_updated_from(stream_slice, stream_state), **self._body_args
+        )
+
+    def _slice_updated_from(self, stream_slice: Mapping[str, Any], stream_state: Mapping[str, Any]) -> Optional[str]:
+        """The slice's pinned filter; falls back to the state for sliceless reads."""
+        if stream_slice and "updated_from" in stream_slice:
+            return stream_slice["updated_from"]
+        return self._state_to_datetime(stream_state)
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Yield a page's records, skipping any prefix of the page that a previous attempt
+        already emitted. Pages can hold far more records than the checkpoint interval,
+        so the position inside the current page is tracked alongside the cursor and a
+        resumed sync re-reads only the unseen tail of the interrupted page.
+
+        Page numbers are only meaningful relative to the ``Updated_From`` filter the
+        page was fetched with, so the checkpoint records that filter and is ignored
+        whenever the current attempt filters differently — a later sync with an
+        advanced cursor starts from the top of its own result set instead of
+        skipping records that were never emitted.
+        """
+        page = (stream_slice or {}).get("page", self.page)
+        updated_from = self._slice_updated_from(stream_slice, stream_state)
+        already_emitted = 0
+        state = stream_state or {}
+        if state.get("page") == page and state.get("updated_from") == updated_from:
+            already_emitted = state.get("record_index", 0)
+        self._checkpoint_page = page
+        self._checkpoint_record_index = already_emitted
+        self._checkpoint_updated_from = updated_from
+        for index, record in enumerate(
+            super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+        ):
+            if index < already_emitted:
+                continue
+            self._checkpoint_record_index = index + 1
+            yield record
+        if page == self._final_page and self._latest_checkpoint is not None:
+            # The sync's last page is done: drop the resume fields from the state the
+            # end-of-slice checkpoint will carry, so the next scheduled sync derives a
+            # fresh filter from the advanced cursor instead of re-running this one.
+            for key in ("page", "record_index", "updated_from"):
+                self._latest_checkpoint.pop(key, None)
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        state = dict(super().get_updated_state(current_stream_state, latest_record))
+        state["page"] = self._checkpoint_page
+        state["record_index"] = self._checkpoint_record_index
+        state["updated_from"] = self._checkpoint_updated_from
+        # Kept so read_records can scrub the resume fields once the last page is done;
+        # the CDK emits this same mapping as the end-of-slice checkpoint.
+        self._latest_checkpoint = state
+        return state
+
+    def _record_cursor_value(self, latest_record: Mapping[str, Any]) -> str:
+        # The parser emits Last_Modified nested under Worker_Data, not at the top of
+        # the record.
+        worker_data = latest_record.get("Worker_Data") or {}
+        return worker_data.get(self._cursor_field) or latest_record.get(self._cursor_field) or ""
+
+    def _state_to_datetime(self, stream_state: Mapping[str, Any]) -> Optional[str]:
+        """
+        Convert the stored cursor into the ISO datetime Workday expects in
+        ``Transaction_Date_Range_Data/Updated_From``. Returns ``None`` on the first
+        sync so the request stays an unfiltered full pull.
+        """
+        cursor = (stream_state or {}).get(self._cursor_field)
+        if not cursor:
+            return None
+        if isinstance(cursor, (int, float)):
+            return datetime.utcfromtimestamp(cursor).strftime(self._INCOMING_DATETIME_FORMAT)
+        return cursor
+
+
+class WorkerDetails(HttpSubStream, KnoeticWorkdayStream):
+    """
+    Worker detail payloads, sliced off the Workers parent stream. WIDs are batched
+    into multi-reference Get_Workers envelopes (up to ``per_page`` per request), so
+    a roster costs one HTTP round-trip per batch instead of one per worker.
+    """
+
+    primary_key = None
+
+    def __init__(self, parent: "Workers", **kwargs):
+        super().__init__(
+            parent=parent,
+            file_name="worker_details.xml",
+            stream_name="worker_details",
+            **kwargs,
+        )
+
+    def stream_slices(
+        self, sync_mode: SyncMode = None, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        batch = []
+        for parent_slice in super().stream_slices(sync_mode=SyncMode.full_refresh):
+            worker_id = _worker_wid(parent_slice["parent"])
+            if worker_id:
+                batch.append(worker_id)
+                if len(batch) >= self.per_page:
+                    yield {"worker_ids": tuple(batch)}
+                    batch.clear()
+        if batch:
+            yield {"worker_ids": tuple(batch)}
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        # The template carries a Response_Filter with the batch size as the page
+        # Count, so one page normally fits the whole batch; the page token still has
+        # to be honoured in case the tenant caps the page size lower.
+        return self.workday_request.construct_worker_batch_request_body(
+            file_name=self.file_name,
+            tenant=self.tenant,
+            username=self.username,
+            password=self.password,
+            page=next_page_token["page"] if next_page_token else self.page,
+            per_page=self.per_page,
+            worker_ids=stream_slice.get("worker_ids"),
+        )
+
+
+class WorkerDetailsPhoto(HttpSubStream, KnoeticWorkdayStream):
+    primary_key = None
+
+    def __init__(self, parent: "Workers", **kwargs):
+        super().__init__(
+            parent=parent,
+            file_name="worker_details_photo.xml",
+            stream_name="worker_details_photo",
+            **kwargs,
+        )
+
+    def stream_slices(
+        self, sync_mode: SyncMode = None, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        for parent_slice in super().stream_slices(sync_mode=SyncMode.full_refresh):
+            worker_id = _worker_wid(parent_slice["parent"])
+            if worker_id:
+                yield {"worker_id": worker_id}
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        return self.workday_request.construct_worker_request_body(
+            file_name=self.file_name,
+            tenant=self.tenant,
+            username=self.username,
+            password=self.password,
+            page=self.page,
+            per_page=self.per_page,
+            worker_id=stream_slice.get("worker_id"),
+        )
+
+
+class WorkerDetailsHistory(HttpSubStream, KnoeticWorkdayStream):
+    """
+    Point-in-time worker snapshots: one request per worker per effective date, from the
+    worker's original hire date through their termination date (or today). Workers come
+    from the parent stream; each parent record expands into its per-day slices.
+    """
+
+    primary_key = None
+    # Non-empty cursor_field marks the stream incremental, so the source checkpoints
+    # the per-worker state below and passes it back into stream_slices on the next run.
+    cursor_field = "as_of_effective_date"
+
+    def __init__(self, parent: "Workers", **kwargs):
+        super().__init__(
+            parent=parent,
+            file_name="worker_details_history.xml",
+            stream_name="worker_details_history",
+            **kwargs,
+        )
+        self._cursor_value = {}
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return self._cursor_value
+
+    @state.setter
+    def state(self, value: Mapping[str, Any]):
+        # dict.update returns None; assigning its result here used to wipe the
+        # accumulated per-worker cursors after the first write, so incremental runs
+        # could never skip already-synced worker-days.
+        self._cursor_value.update(value)
+
+    def stream_slices(
+        self, sync_mode: SyncMode = None, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        # Dates are handled as ordinals so the per-day loop is integer arithmetic plus
+        # one C-level fromordinal/isoformat per slice, instead of strptime/timedelta/
+        # strftime object churn for every day of every worker's tenure.
+        stream_state = stream_state or self.state
+        today_ordinal = date.today().toordinal()
+        for parent_slice in super().stream_slices(sync_mode=SyncMode.full_refresh):
+            worker = parent_slice["parent"]
+            worker_id = _worker_wid(worker)
+            status_data = worker.get("Worker_Data", {}).get("Employment_Data", {}).get("Worker_Status_Data", {})
+            original_hire_date = status_data.get("Original_Hire_Date")
+            termination_date = status_data.get("Termination_Date")
+            if not worker_id or not original_hire_date:
+                continue
+
+            state_date = stream_state.get(worker_id)
+            if state_date:
+                start_ordinal = date.fromisoformat(state_date).toordinal() + 1
+            else:
+                start_ordinal = date.fromisoformat(original_hire_date).toordinal()
+            end_ordinal = date.fromisoformat(termination_date).toordinal() if termination_date else today_ordinal
+            if start_ordinal > end_ordinal:
+                # Already synced through this worker's end date; nothing to re-read.
+                continue
+
+            for ordinal in range(start_ordinal, end_ordinal + 1):
+                yield {"Worker_ID": worker_id, "as_of_effective_date": date.fromordinal(ordinal).isoformat()}
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        return self.workday_request.construct_worker_request_body(
+            file_name=self.file_name,
+            tenant=self.tenant,
+            username=self.username,
+            password=self.password,
+            page=self.page,
+            per_page=self.per_page,
+            worker_id=stream_slice.get("Worker_ID"),
+            as_of_effective_date=stream_slice.get("as_of_effective_date"),
+        )
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        # The slice already carries the worker's WID; no need to rescan each record's
+        # Worker_Reference list for it.
+        worker_id = stream_slice.get("Worker_ID")
+        as_of_effective_date = stream_slice.get("as_of_effective_date")
+        for record in super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state):
+            yield {**record, "as_of_effective_date": as_of_effective_date}
+            self.state = {worker_id: as_of_effective_date}
+
+
+class References(KnoeticWorkdayStream):
+    primary_key = None
+
+    def __init__(
+        self,
+        url: str,
+        tenant: str,
+        username: str,
+        password: str,
+        workday_request: WorkdayRequest,
+        per_page: int = 200,
+        page: int = 1,
+    ):
+        super().__init__(
+            url=url,
+            tenant=tenant,
+            username=username,
+            password=password,
+            workday_request=workday_request,
+            web_service="Integrations",
+            file_name="references.xml",
+            stream_name="references",
+            per_page=per_page,
+            page=page,
+        )
+        self.reference_types = _REFERENCE_TYPES
+        # The slice set is fixed at construction; the CDK may call stream_slices
+        # several times (planning, retries), so build it once.
+        self._slices = tuple({"reference_type": reference_type} for reference_type in self.reference_types)
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    def request_body_data(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Optional[str]:
+        page = next_page_token["page"] if next_page_token else self.page
+        return self.workday_request.construct_paged_request_body(
+            page=page, reference_subcategory_type=stream_slice.get("reference_type"), **self._body_args
+        )
+
+    def parse_response(self, response: requests.Response, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping]:
+        reference_type = stream_slice.get("reference_type")
+        parsed_response = self.workday_request.parse_response(response, stream_name=self.stream_name)
+        yield from ({**record, "reference_type": reference_type} for record in parsed_response)
+
+
+_SIMPLE_STREAMS = (
+    # (stream_name, template file, web service)
+    ("ethnicities", "ethnicities.xml", "Human_Resources"),
+    ("gender_identities", "gender_identities.xml", "Human_Resources"),
+    ("locations", "locations.xml", "Human_Resources"),
+    ("job_profiles", "job_profiles.xml", "Human_Resources"),
+    ("positions", "positions.xml", "Staffing"),
+    ("sexual_orientations", "sexual_orientations.xml", "Human_Resources"),
+    ("organization_hierarchies", "organization_hierarchies.xml", "Human_Resources"),
+)
+
+
+def _make_simple_stream_class(stream_name: str, file_name: str, web_service: str) -> type:
+    """
+    Build a stream class for a plain paginated lookup endpoint. These streams differ
+    only in their template file, stream name and web service, so the classes are
+    generated from ``_SIMPLE_STREAMS`` instead of being written out by hand.
+    """
+
+    def __init__(self, **kwargs):
+        KnoeticWorkdayStream.__init__(
+            self, web_service=web_service, file_name=file_name, stream_name=stream_name, **kwargs
+        )
+
+    class_name = "".join(part.capitalize() for part in stream_name.split("_"))
+    # __module__ must point here, not at abc (where ABCMeta creates the class), or
+    # the CDK's schema loader resolves the schemas/ package relative to the stdlib.
+    return type(class_name, (KnoeticWorkdayStream,), {"primary_key": None, "__init__": __init__, "__module__": __name__})
+
+
+Ethnicities = _make_simple_stream_class(*_SIMPLE_STREAMS[0])
+GenderIdentities = _make_simple_stream_class(*_SIMPLE_STREAMS[1])
+Locations = _make_simple_stream_class(*_SIMPLE_STREAMS[2])
+JobProfiles = _make_simple_stream_class(*_SIMPLE_STREAMS[3])
+Positions = _make_simple_stream_class(*_SIMPLE_STREAMS[4])
+SexualOrientations = _make_simple_stream_class(*_SIMPLE_STREAMS[5])
+OrganizationHierarchies = _make_simple_stream_class(*_SIMPLE_STREAMS[6])
+
+
+class BaseCustomReport(HttpStream):
+    """
+    Custom Report-as-a-Service (RaaS) reports. Each configured report is fetched with a
+    single GET against the ``customreport2`` endpoint, either as CSV (snapshot) or XML
+    (historical reports).
+    """
+
+    primary_key = None
+    http_method = "GET"
+
+    def __init__(
+        self,
+        url: str,
+        tenant: str,
+        username: str,
+        password: str,
+        workday_request: WorkdayRequest,
+        base_snapshot_report: Optional[str] = None,
+        base_historical_report_compensation: Optional[str] = None,
+        base_historical_report_job: Optional[str] = None,
+    ):
+        super().__init__(api_budget=_API_BUDGET)
+        self.url = url
+        self.tenant = tenant
+        self.username = username
+        self.password = password
+        self.workday_request = workday_request
+        self._url_base = url
+        self.base_snapshot_report = base_snapshot_report
+        self.base_historical_report_compensation = base_historical_report_compensation
+        self.base_historical_report_job = base_historical_report_job
+        self._session = _SHARED_SESSION
+        # Credentials never change within a sync; encode the Authorization value once
+        # instead of base64-encoding it again for every report request, and keep one
+        # ready-made header dict per report format.
+        self._basic_auth = "Basic " + base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("utf-8")
+        # CaseInsensitiveDict matches what requests stores on the prepared request,
+        # so the returned headers merge without per-request re-normalization.
+        self._headers_by_format = {
+            "csv": CaseInsensitiveDict({"Authorization": self._basic_auth, "Accept": "text/csv"}),
+            "xml": CaseInsensitiveDict({"Authorization": self._basic_auth, "Accept": "application/xml"}),
+        }
+        # The configured reports never change after construction.
+        slices = []
+        if base_snapshot_report:
+            slices.append({"report_name": base_snapshot_report, "format_type": "csv"})
+        if base_historical_report_compensation:
+            slices.append({"report_name": base_historical_report_compensation, "format_type": "xml"})
+        if base_historical_report_job:
+            slices.append({"report_name": base_historical_report_job, "format_type": "xml"})
+        self._slices = tuple(slices)
+        # Pre-render each slice's path, including the query separator for report names
+        # that already carry query parameters, so path() is a plain dict lookup.
+        self._path_by_slice = {}
+        for stream_slice in self._slices:
+            report_name, format_type = stream_slice["report_name"], stream_slice["format_type"]
+            url_query_char = "&" if "?" in report_name else "?"
+            self._path_by_slice[(report_name, format_type)] = (
+                f"customreport2/{tenant}/{username}/{report_name}{url_query_char}format={format_type}"
+            )
+        # Maps each configured report name to the parser key for its record layout.
+        self._stream_name_by_report = {
+            base_snapshot_report: "base_snapshot_report",
+            base_historical_report_compensation: "base_historical_report_compensation",
+            base_historical_report_job: "base_historical_report_job",
+        }
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def request_kwargs(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        # Reports can run to hundreds of MB; stream them off the socket so records are
+        # parsed as the body arrives instead of after it is fully buffered.
+        return {"stream": True}
+
+    def request_headers(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        return self._headers_by_format.get(stream_slice.get("format_type"), self._headers_by_format["xml"])
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    def path(
+        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> str:
+        return self._path_by_slice[(stream_slice.get("report_name"), stream_slice.get("format_type"))]
+
+    def parse_response(self, response: requests.Response, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping]:
+        stream_name = self._stream_name_by_report.get(stream_slice.get("report_name"), "base_historical_report_job")
+        yield from self.workday_request.parse_response(response, stream_name=stream_name)
+
+
+class SourceKnoeticWorkday(ConcurrentSourceAdapter):
+    """
+    The per-worker substreams issue one small POST per worker (or per worker-day), so
+    their slices are dispatched through the concurrent CDK's thread pool instead of
+    being fetched one after another.
+    """
+
+    message_repository = InMemoryMessageRepository()
+
+    def __init__(self, config: Optional[Mapping[str, Any]] = None, **kwargs):
+        concurrency_level = min((config or {}).get("num_workers", _DEFAULT_CONCURRENCY), _MAX_CONCURRENCY)
+        concurrent_source = ConcurrentSource.create(
+            concurrency_level, concurrency_level // 2, logger, self._slice_logger, self.message_repository
+        )
+        super().__init__(concurrent_source)
+
+    def _to_concurrent(self, stream: Stream) -> Stream:
+        return StreamFacade.create_from_stream(stream, self, logger, {}, NoopCursor())
+
+    def check_connection(self, logger, config) -> Tuple[bool, Any]:
+        try:
+            stream = Workers(
+                url=config["url"],
+                tenant=config["tenant"],
+                username=config["username"],
+                password=config["password"],
+                workday_request=WorkdayRequest(),
+                per_page=1,
+                page=1,
+            )
+            next(iter(stream.read_records(sync_mode=SyncMode.full_refresh)), None)
+            return True, None
+        except Exception as error:
+            return False, f"Unable to connect to Workday tenant: {error}"
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        url = config["url"]
+        tenant = config["tenant"]
+        username = config["username"]
+        password = config["password"]
+        per_page = config.get("per_page", 200)
+        workday_request = WorkdayRequest()
+
+        workers_stream = Workers(
+            url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page
+        )
+        substream_args = {
+            "url": url,
+            "tenant": tenant,
+            "username": username,
+            "password": password,
+            "workday_request": workday_request,
+            "per_page": per_page,
+        }
+
+        return [
+            workers_stream,
+            self._to_concurrent(WorkerDetails(parent=workers_stream, **substream_args)),
+            self._to_concurrent(WorkerDetailsPhoto(parent=workers_stream, **substream_args)),
+            # History stays on the classic read path: the concurrent facade's NoopCursor
+            # discards state, and this is the one stream whose per-worker cursor must be
+            # checkpointed so a resumed sync can skip already-synced worker-days.
+            WorkerDetailsHistory(parent=workers_stream, **substream_args),
+            # The 12 reference-type slices are independent round-trips; fan them out.
+            self._to_concurrent(
+                References(
+                    url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page
+                )
+            ),
+            Ethnicities(url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page),
+            GenderIdentities(
+                url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page
+            ),
+            Locations(url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page),
+            JobProfiles(url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page),
+            Positions(url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page),
+            SexualOrientations(
+                url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page
+            ),
+            OrganizationHierarchies(
+                url=url, tenant=tenant, username=username, password=password, workday_request=workday_request, per_page=per_page
+            ),
+            # The report slices are disjoint downloads, so they fan out through the
+            # concurrent CDK's thread pool instead of running back to back.
+            self._to_concurrent(
+                BaseCustomReport(
+                    url=url,
+                    tenant=tenant,
+                    username=username,
+                    password=password,
+                    workday_request=workday_request,
+                    base_snapshot_report=config.get("base_snapshot_report"),
+                    base_historical_report_compensation=config.get("base_historical_report_compensation"),
+                    base_historical_report_job=config.get("base_historical_report_job"),
+                )
+            ),
+        ]
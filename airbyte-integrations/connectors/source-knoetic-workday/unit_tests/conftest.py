@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from source_knoetic_workday.workday_request import WorkdayRequest
+
+WORKERS_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<env:Envelope xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
+  <env:Body>
+    <wd:Get_Workers_Response xmlns:wd="urn:com.workday/bsvc" wd:version="v37.2">
+      <wd:Response_Results>
+        <wd:Total_Results>2</wd:Total_Results>
+        <wd:Total_Pages>1</wd:Total_Pages>
+        <wd:Page_Results>2</wd:Page_Results>
+        <wd:Page>1</wd:Page>
+      </wd:Response_Results>
+      <wd:Response_Data>
+        <wd:Worker>
+          <wd:Worker_Reference>
+            <wd:ID wd:type="WID">wid-0001</wd:ID>
+            <wd:ID wd:type="Employee_ID">21001</wd:ID>
+          </wd:Worker_Reference>
+          <wd:Worker_Descriptor>Adam Smith</wd:Worker_Descriptor>
+          <wd:Worker_Data>
+            <wd:Worker_ID>21001</wd:Worker_ID>
+            <wd:Last_Modified>2024-01-02T03:04:05</wd:Last_Modified>
+            <wd:Employment_Data>
+              <wd:Worker_Status_Data>
+                <wd:Original_Hire_Date>2020-01-01</wd:Original_Hire_Date>
+                <wd:Hire_Date>2020-01-01</wd:Hire_Date>
+              </wd:Worker_Status_Data>
+            </wd:Employment_Data>
+          </wd:Worker_Data>
+        </wd:Worker>
+        <wd:Worker>
+          <wd:Worker_Reference>
+            <wd:ID wd:type="WID">wid-0002</wd:ID>
+            <wd:ID wd:type="Employee_ID">21002</wd:ID>
+          </wd:Worker_Reference>
+          <wd:Worker_Descriptor>Berta Lovelace</wd:Worker_Descriptor>
+          <wd:Worker_Data>
+            <wd:Worker_ID>21002</wd:Worker_ID>
+            <wd:Last_Modified>2024-02-03T04:05:06</wd:Last_Modified>
+            <wd:Employment_Data>
+              <wd:Worker_Status_Data>
+                <wd:Original_Hire_Date>2021-06-01</wd:Original_Hire_Date>
+                <wd:Hire_Date>2021-06-01</wd:Hire_Date>
+                <wd:Termination_Date>2021-06-04</wd:Termination_Date>
+              </wd:Worker_Status_Data>
+            </wd:Employment_Data>
+          </wd:Worker_Data>
+        </wd:Worker>
+      </wd:Response_Data>
+    </wd:Get_Workers_Response>
+  </env:Body>
+</env:Envelope>
+"""
+
+SNAPSHOT_REPORT_CSV = "Employee_ID,First_Name,Last_Name\n21001,Adam,Smith\n21002,Berta,Lovelace\n"
+
+WORKERS_PAGE_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<env:Envelope xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
+  <env:Body>
+    <wd:Get_Workers_Response xmlns:wd="urn:com.workday/bsvc" wd:version="v37.2">
+      <wd:Response_Results>
+        <wd:Total_Results>{total_results}</wd:Total_Results>
+        <wd:Total_Pages>{total_pages}</wd:Total_Pages>
+        <wd:Page_Results>1</wd:Page_Results>
+        <wd:Page>{page}</wd:Page>
+      </wd:Response_Results>
+      <wd:Response_Data>
+        <wd:Worker>
+          <wd:Worker_Reference>
+            <wd:ID wd:type="WID">wid-page-{page}</wd:ID>
+            <wd:ID wd:type="Employee_ID">2100{page}</wd:ID>
+          </wd:Worker_Reference>
+          <wd:Worker_Descriptor>Worker {page}</wd:Worker_Descriptor>
+          <wd:Worker_Data>
+            <wd:Worker_ID>2100{page}</wd:Worker_ID>
+            <wd:Last_Modified>2024-01-0{page}T00:00:00</wd:Last_Modified>
+          </wd:Worker_Data>
+        </wd:Worker>
+      </wd:Response_Data>
+    </wd:Get_Workers_Response>
+  </env:Body>
+</env:Envelope>
+"""
+
+
+@pytest.fixture(name="make_workers_page")
+def make_workers_page_fixture():
+    def _make(page: int, total_pages: int, total_results: int = None) -> str:
+        return WORKERS_PAGE_TEMPLATE.format(
+            page=page, total_pages=total_pages, total_results=total_results if total_results is not None else total_pages
+        )
+
+    return _make
+
+
+@pytest.fixture(name="config")
+def config_fixture():
+    return {
+        "url": "https://wd2-impl-services1.workday.com/ccx/service/",
+        "tenant": "acme",
+        "username": "ISU_airbyte",
+        "password": "hunter2",
+        "per_page": 200,
+        "base_snapshot_report": "base_snapshot_report",
+        "base_historical_report_compensation": "base_historical_report_compensation",
+        "base_historical_report_job": "base_historical_report_job",
+    }
+
+
+@pytest.fixture(name="workday_request")
+def workday_request_fixture():
+    return WorkdayRequest()
+
+
+@pytest.fixture(name="workers_response")
+def workers_response_fixture():
+    return WORKERS_RESPONSE
+
+
+@pytest.fixture(name="snapshot_report_csv")
+def snapshot_report_csv_fixture():
+    return SNAPSHOT_REPORT_CSV
+
+
+@pytest.fixture(name="soap_endpoint")
+def soap_endpoint_fixture(config):
+    return f"{config['url']}{config['tenant']}/Human_Resources/37.2"
@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime
+
+from airbyte_cdk.models import SyncMode
+
+from source_knoetic_workday.source import Workers
+
+
+def make_stream(config, workday_request):
+    return Workers(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+        per_page=config["per_page"],
+    )
+
+
+def test_cursor_field(config, workday_request):
+    stream = make_stream(config, workday_request)
+    assert stream.cursor_field == "Last_Modified"
+
+
+def test_get_updated_state_no_previous_state(config, workday_request):
+    stream = make_stream(config, workday_request)
+    record = {"Last_Modified": "2024-01-02T03:04:05"}
+    state = stream.get_updated_state(current_stream_state={}, latest_record=record)
+    assert state["Last_Modified"] == "2024-01-02T03:04:05"
+
+
+def test_get_updated_state_keeps_most_recent(config, workday_request):
+    stream = make_stream(config, workday_request)
+    record = {"Last_Modified": "2024-01-02T03:04:05"}
+    state = stream.get_updated_state(current_stream_state={"Last_Modified": "2024-06-01T00:00:00"}, latest_record=record)
+    assert state["Last_Modified"] == "2024-06-01T00:00:00"
+
+
+def test_get_updated_state_upgrades_legacy_timestamp_state(config, workday_request):
+    stream = make_stream(config, workday_request)
+    legacy = datetime(2024, 6, 1).timestamp()
+    record = {"Last_Modified": "2024-01-02T03:04:05"}
+    state = stream.get_updated_state(current_stream_state={"Last_Modified": legacy}, latest_record=record)
+    assert state["Last_Modified"] > "2024-01-02T03:04:05"
+
+
+def test_get_updated_state_reads_cursor_from_parsed_records(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    # Drive the cursor with records as the parser actually emits them: Last_Modified
+    # sits under Worker_Data, not at the top level of the record.
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    state = {}
+    for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"page": 1}):
+        state = stream.get_updated_state(state, record)
+    assert state["Last_Modified"] == "2024-02-03T04:05:06"
+
+
+def test_request_body_data_without_state_has_no_date_filter(config, workday_request):
+    stream = make_stream(config, workday_request)
+    body = stream.request_body_data(stream_state={}).decode("utf-8")
+    assert "Transaction_Log_Criteria_Data" not in body
+
+
+def test_request_body_data_sends_cursor_as_updated_from(config, workday_request):
+    stream = make_stream(config, workday_request)
+    body = stream.request_body_data(stream_state={"Last_Modified": 1704164645.0}).decode("utf-8")
+    assert "<wd:Updated_From>2024-01-02T03:04:05</wd:Updated_From>" in body
+
+
+def test_request_body_data_pins_updated_from_to_the_slice(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    slices = stream.stream_slices(sync_mode=SyncMode.incremental, stream_state={"Last_Modified": "2024-01-01T00:00:00"})
+    assert slices == [{"page": 1, "updated_from": "2024-01-01T00:00:00"}]
+    # The live cursor advances while records are emitted; later pages must keep the
+    # filter their page numbers were probed against, not chase the moving state.
+    advanced_state = {"Last_Modified": "2024-06-01T00:00:00"}
+    body = stream.request_body_data(stream_state=advanced_state, stream_slice=slices[0]).decode("utf-8")
+    assert "<wd:Updated_From>2024-01-01T00:00:00</wd:Updated_From>" in body
+
+
+def test_state_checkpoint_interval(config, workday_request):
+    stream = make_stream(config, workday_request)
+    assert stream.state_checkpoint_interval == 1000
+
+
+def test_read_records_skips_already_emitted_prefix_on_resume(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    state = {"Last_Modified": 1704164645.0, "page": 1, "record_index": 1, "updated_from": "2024-01-02T03:04:05"}
+    records = list(
+        stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"page": 1}, stream_state=state)
+    )
+    assert len(records) == 1
+    assert records[0]["Worker_Data"]["Worker_ID"] == "21002"
+
+
+def test_read_records_ignores_checkpoint_from_a_different_filter(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    # The checkpoint was taken against an older Updated_From filter; the cursor has
+    # advanced since, so page numbering no longer lines up and nothing may be skipped.
+    state = {"Last_Modified": "2024-06-01T00:00:00", "page": 1, "record_index": 2, "updated_from": "2024-01-02T03:04:05"}
+    records = list(
+        stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"page": 1}, stream_state=state)
+    )
+    assert len(records) == 2
+
+
+def test_stream_slices_resume_an_interrupted_sync_with_its_original_filter(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    # The cursor advanced past the filter while the interrupted attempt ran; the
+    # resumed sync must keep the checkpoint's filter or the skip can never match.
+    state = {"Last_Modified": "2024-06-01T00:00:00", "page": 1, "record_index": 1, "updated_from": "2024-01-01T00:00:00"}
+    slices = stream.stream_slices(sync_mode=SyncMode.incremental, stream_state=state)
+    assert slices == [{"page": 1, "updated_from": "2024-01-01T00:00:00"}]
+    records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=slices[0], stream_state=state))
+    assert len(records) == 1
+    assert records[0]["Worker_Data"]["Worker_ID"] == "21002"
+
+
+def test_completed_sync_checkpoint_drops_the_resume_fields(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    state = {}
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental, stream_state=state):
+        for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state=state):
+            state = stream.get_updated_state(state, record)
+    # Once the final page finishes, only the cursor remains, so the next scheduled
+    # sync filters from it instead of resuming (and re-filtering) this one.
+    assert state == {"Last_Modified": "2024-02-03T04:05:06"}
+
+
+def test_get_updated_state_tracks_position_within_page(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    stream = make_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    state = {}
+    for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"page": 1}, stream_state=state):
+        state = stream.get_updated_state(state, record)
+    assert state["page"] == 1
+    assert state["record_index"] == 2
+    assert state["updated_from"] is None  # first sync: no Updated_From filter
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+from source_knoetic_workday.source import SourceKnoeticWorkday
+
+
+def test_check_connection_ok(config, requests_mock, soap_endpoint, workers_response):
+    requests_mock.post(soap_endpoint, text=workers_response)
+    source = SourceKnoeticWorkday()
+    assert source.check_connection(MagicMock(), config) == (True, None)
+
+
+def test_check_connection_fail(config, requests_mock, soap_endpoint):
+    requests_mock.post(soap_endpoint, status_code=401, text="Unauthorized")
+    source = SourceKnoeticWorkday()
+    ok, error = source.check_connection(MagicMock(), config)
+    assert not ok
+    assert error
+
+
+def test_streams(config, requests_mock, soap_endpoint, workers_response):
+    requests_mock.post(soap_endpoint, text=workers_response)
+    source = SourceKnoeticWorkday()
+    streams = source.streams(config)
+    assert len(streams) == 13
+    stream_names = {stream.name for stream in streams}
+    assert "workers" in stream_names
+    assert "base_custom_report" in stream_names
+
+
+def test_discover_resolves_schemas_for_generated_streams(config):
+    source = SourceKnoeticWorkday()
+    catalog = source.discover(MagicMock(), config)
+    assert len(catalog.streams) == 13
+    ethnicities = next(stream for stream in catalog.streams if stream.name == "ethnicities")
+    assert ethnicities.json_schema
+
+
+def test_substreams_slice_off_workers_parent(config, requests_mock, soap_endpoint, workers_response):
+    requests_mock.post(soap_endpoint, text=workers_response)
+    source = SourceKnoeticWorkday()
+    streams = source.streams(config)
+    workers = next(stream for stream in streams if stream.name == "workers")
+    # worker_details comes back wrapped in the concurrent facade; history is served
+    # unwrapped so its incremental state survives the sync.
+    worker_details = next(stream for stream in streams if stream.name == "worker_details")._legacy_stream
+    history = next(stream for stream in streams if stream.name == "worker_details_history")
+
+    assert worker_details.parent is workers
+    assert history.parent is workers
+    # No requests are made until a substream is actually sliced.
+    assert not requests_mock.request_history
+    assert list(worker_details.stream_slices()) == [{"worker_ids": ("wid-0001", "wid-0002")}]
+
+
+def test_num_workers_config_drives_concurrency(config, mocker):
+    create = mocker.patch("source_knoetic_workday.source.ConcurrentSource.create")
+    SourceKnoeticWorkday({**config, "num_workers": 50})
+    assert create.call_args[0][0] == 20  # capped at _MAX_CONCURRENCY
+    SourceKnoeticWorkday(config)
+    assert create.call_args[0][0] == 10  # _DEFAULT_CONCURRENCY
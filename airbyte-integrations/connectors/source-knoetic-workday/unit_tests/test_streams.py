@@ -0,0 +1,285 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+from datetime import date
+
+import requests
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.call_rate import LimiterSession
+from source_knoetic_workday.source import _API_BUDGET, BaseCustomReport, References, WorkerDetails, WorkerDetailsHistory, Workers
+
+
+def make_workers_stream(config, workday_request, **kwargs):
+    return Workers(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+        per_page=config["per_page"],
+        **kwargs,
+    )
+
+
+def make_base_custom_report(config, workday_request):
+    return BaseCustomReport(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+        base_snapshot_report=config["base_snapshot_report"],
+        base_historical_report_compensation=config["base_historical_report_compensation"],
+        base_historical_report_job=config["base_historical_report_job"],
+    )
+
+
+def test_path(config, workday_request):
+    stream = make_workers_stream(config, workday_request)
+    assert stream.path() == "acme/Human_Resources/37.2"
+    assert stream.url_base == config["url"]
+
+
+def test_request_body_data(config, workday_request):
+    stream = make_workers_stream(config, workday_request)
+    body = stream.request_body_data(stream_state={}).decode("utf-8")
+    assert "ISU_airbyte@acme" in body
+    assert "hunter2" in body
+    assert "<wd:Page>1</wd:Page>" in body
+    assert "<wd:Count>200</wd:Count>" in body
+
+
+def test_session_uses_pooled_adapter(config, workday_request):
+    stream = make_workers_stream(config, workday_request)
+    adapter = stream._session.get_adapter(config["url"])
+    assert adapter._pool_connections == 20
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 5
+
+
+def test_session_is_shared_across_streams(config, workday_request):
+    workers = make_workers_stream(config, workday_request)
+    references = make_references_stream(config, workday_request)
+    report = make_base_custom_report(config, workday_request)
+    assert workers._session is references._session
+    assert workers._session is report._session
+
+
+def test_session_enforces_call_rate_budget(config, workday_request, mocker):
+    stream = make_workers_stream(config, workday_request)
+    assert isinstance(stream._session, LimiterSession)
+    assert stream._session._api_budget is _API_BUDGET
+
+    acquire = mocker.patch.object(_API_BUDGET, "acquire_call")
+    request = requests.Request(method="POST", url="https://wd2-impl-services1.workday.com/ccx/service/acme").prepare()
+    mocker.patch.object(requests.Session, "send")
+    stream._session.send(request)
+    acquire.assert_called_once()
+
+
+def make_references_stream(config, workday_request):
+    return References(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+    )
+
+
+def test_next_page_token_single_page(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_references_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    response = requests.post(soap_endpoint)
+    assert stream.next_page_token(response) is None
+
+
+def test_next_page_token_more_pages(config, workday_request, requests_mock, soap_endpoint, make_workers_page):
+    stream = make_references_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=make_workers_page(page=1, total_pages=3))
+    response = requests.post(soap_endpoint)
+    assert stream.next_page_token(response) == {"page": 2}
+
+
+def test_workers_stream_slices_cover_all_pages(config, workday_request, requests_mock, soap_endpoint, make_workers_page):
+    stream = make_workers_stream(config, workday_request)
+    stream.per_page = 1
+    requests_mock.post(soap_endpoint, text=make_workers_page(page=1, total_pages=2, total_results=2))
+    assert stream.stream_slices(sync_mode=SyncMode.incremental) == [
+        {"page": 1, "updated_from": None},
+        {"page": 2, "updated_from": None},
+    ]
+
+
+def test_read_records_covers_all_pages_via_slices(config, workday_request, requests_mock, soap_endpoint, make_workers_page):
+    stream = make_workers_stream(config, workday_request)
+    stream.per_page = 1
+    requests_mock.post(
+        soap_endpoint,
+        [
+            {"text": make_workers_page(page=1, total_pages=2, total_results=2)},  # probe
+            {"text": make_workers_page(page=1, total_pages=2, total_results=2)},
+            {"text": make_workers_page(page=2, total_pages=2, total_results=2)},
+        ],
+    )
+    records = [
+        record
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental)
+        for record in stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice)
+    ]
+    assert len(records) == 2
+    assert "<wd:Page>2</wd:Page>" in requests_mock.request_history[-1].text
+
+
+def test_parse_response(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_workers_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert len(records) == 2
+    assert records[0]["Worker_Descriptor"] == "Adam Smith"
+    assert records[0]["Worker_Reference"]["ID"][0] == {"-type": "WID", "#content": "wid-0001"}
+    assert records[1]["Worker_Data"]["Worker_ID"] == "21002"
+
+
+def make_worker_details_stream(cls, config, workday_request):
+    parent = make_workers_stream(config, workday_request)
+    return cls(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+        parent=parent,
+    )
+
+
+def test_worker_details_stream_slices_batch_wids(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_worker_details_stream(WorkerDetails, config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    assert list(stream.stream_slices()) == [{"worker_ids": ("wid-0001", "wid-0002")}]
+    body = stream.request_body_data(stream_state={}, stream_slice={"worker_ids": ("wid-0001", "wid-0002")})
+    assert body.count("<wd:Worker_Reference>") == 2
+    assert '<wd:ID wd:type="WID">wid-0001</wd:ID>' in body
+    assert '<wd:ID wd:type="WID">wid-0002</wd:ID>' in body
+    # The batch envelope must page its response, or a tenant-side page cap would
+    # leave next_page_token re-requesting an identical page 1 forever.
+    assert "<wd:Page>1</wd:Page>" in body
+    assert "<wd:Count>200</wd:Count>" in body
+
+
+def test_worker_details_request_body_honours_the_page_token(config, workday_request):
+    stream = make_worker_details_stream(WorkerDetails, config, workday_request)
+    body = stream.request_body_data(
+        stream_state={}, stream_slice={"worker_ids": ("wid-0001", "wid-0002")}, next_page_token={"page": 2}
+    )
+    assert "<wd:Page>2</wd:Page>" in body
+
+
+def test_worker_details_batches_split_at_per_page(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_worker_details_stream(WorkerDetails, config, workday_request)
+    stream.per_page = 1
+    requests_mock.post(soap_endpoint, text=workers_response)
+    assert list(stream.stream_slices()) == [{"worker_ids": ("wid-0001",)}, {"worker_ids": ("wid-0002",)}]
+
+
+def test_worker_details_history_stream_slices(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_worker_details_stream(WorkerDetailsHistory, config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    first_slice = next(iter(stream.stream_slices()))
+    assert first_slice == {"Worker_ID": "wid-0001", "as_of_effective_date": "2020-01-01"}
+
+
+def test_worker_details_history_resumes_from_state(config, workday_request, requests_mock, soap_endpoint, workers_response):
+    stream = make_worker_details_stream(WorkerDetailsHistory, config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    state = {"wid-0001": date.today().isoformat(), "wid-0002": "2021-06-03"}
+    slices = list(stream.stream_slices(stream_state=state))
+    assert slices == [{"Worker_ID": "wid-0002", "as_of_effective_date": "2021-06-04"}]
+
+
+def test_worker_details_history_slices_fall_back_to_stream_state_property(
+    config, workday_request, requests_mock, soap_endpoint, workers_response
+):
+    # Production full-refresh reads call stream_slices without a stream_state
+    # argument; the slices must still honour the checkpointed state property.
+    stream = make_worker_details_stream(WorkerDetailsHistory, config, workday_request)
+    requests_mock.post(soap_endpoint, text=workers_response)
+    stream.state = {"wid-0001": date.today().isoformat(), "wid-0002": "2021-06-03"}
+    assert list(stream.stream_slices()) == [{"Worker_ID": "wid-0002", "as_of_effective_date": "2021-06-04"}]
+
+
+def test_worker_details_history_state_accumulates_per_worker(config, workday_request):
+    stream = make_worker_details_stream(WorkerDetailsHistory, config, workday_request)
+    stream.state = {"wid-0001": "2024-01-01"}
+    stream.state = {"wid-0002": "2024-02-02"}
+    stream.state = {"wid-0001": "2024-01-05"}
+    assert stream.state == {"wid-0001": "2024-01-05", "wid-0002": "2024-02-02"}
+
+
+def test_references_stream_slices(config, workday_request):
+    stream = References(
+        url=config["url"],
+        tenant=config["tenant"],
+        username=config["username"],
+        password=config["password"],
+        workday_request=workday_request,
+    )
+    slices = list(stream.stream_slices())
+    assert len(slices) == 12
+    assert slices[0] == {"reference_type": "Contingent_Worker_Type_ID"}
+    body = stream.request_body_data(stream_state={}, stream_slice=slices[0]).decode("utf-8")
+    assert "<wd:Reference_ID_Type>Contingent_Worker_Type_ID</wd:Reference_ID_Type>" in body
+
+
+def test_base_custom_report_stream_slices(config, workday_request):
+    stream = make_base_custom_report(config, workday_request)
+    assert list(stream.stream_slices()) == [
+        {"report_name": "base_snapshot_report", "format_type": "csv"},
+        {"report_name": "base_historical_report_compensation", "format_type": "xml"},
+        {"report_name": "base_historical_report_job", "format_type": "xml"},
+    ]
+
+
+def test_base_custom_report_path_and_headers(config, workday_request):
+    stream = make_base_custom_report(config, workday_request)
+    stream_slice = {"report_name": "base_snapshot_report", "format_type": "csv"}
+    assert stream.path(stream_slice=stream_slice) == "customreport2/acme/ISU_airbyte/base_snapshot_report?format=csv"
+
+    headers = stream.request_headers(stream_state={}, stream_slice=stream_slice)
+    expected_auth = base64.b64encode(b"ISU_airbyte:hunter2").decode("utf-8")
+    assert headers["Authorization"] == f"Basic {expected_auth}"
+    assert headers["Accept"] == "text/csv"
+    assert headers is stream.request_headers(stream_state={}, stream_slice=stream_slice)
+
+
+def test_base_custom_report_parse_csv(config, workday_request, requests_mock, snapshot_report_csv):
+    stream = make_base_custom_report(config, workday_request)
+    stream_slice = {"report_name": "base_snapshot_report", "format_type": "csv"}
+    requests_mock.get(
+        f"{config['url']}customreport2/acme/ISU_airbyte/base_snapshot_report?format=csv",
+        text=snapshot_report_csv,
+    )
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+    assert records == [
+        {"Employee_ID": "21001", "First_Name": "Adam", "Last_Name": "Smith"},
+        {"Employee_ID": "21002", "First_Name": "Berta", "Last_Name": "Lovelace"},
+    ]
+
+
+def test_request_headers_advertise_compression(config, workday_request):
+    stream = make_workers_stream(config, workday_request)
+    headers = stream.request_headers(stream_state={})
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+    assert headers is stream.request_headers(stream_state={})
+
+
+def test_probe_uses_count_only_template(config, workday_request, requests_mock, soap_endpoint, make_workers_page):
+    stream = make_workers_stream(config, workday_request)
+    requests_mock.post(soap_endpoint, text=make_workers_page(page=1, total_pages=1, total_results=401))
+    assert stream._probe_total_pages() == 3  # ceil(401 / 200)
+    probe_body = requests_mock.request_history[0].text
+    assert "<wd:Count>1</wd:Count>" in probe_body
+    assert "Response_Group" not in probe_body
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+from source_knoetic_workday.workday_request import WorkdayRequest
+
+
+def test_construct_request_body_substitutes_placeholders(workday_request):
+    body = workday_request.construct_request_body(
+        file_name="workers.xml", tenant="acme", username="ISU_airbyte", password="hunter2", page=3, per_page=50
+    )
+    assert "<wsse:Username>ISU_airbyte@acme</wsse:Username>" in body
+    assert "<wd:Page>3</wd:Page>" in body
+    assert "<wd:Count>50</wd:Count>" in body
+
+
+def test_template_is_loaded_once(workday_request):
+    WorkdayRequest._load_template.cache_clear()
+    workday_request.construct_request_body(
+        file_name="workers.xml", tenant="acme", username="u", password="p", page=1, per_page=10
+    )
+    workday_request.construct_request_body(
+        file_name="workers.xml", tenant="acme", username="u", password="p", page=2, per_page=10
+    )
+    info = WorkdayRequest._load_template.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_parse_response_workers(workday_request, workers_response):
+    response = MagicMock()
+    response.content = workers_response.encode("utf-8")
+    records = list(workday_request.parse_response(response, stream_name="workers"))
+    assert len(records) == 2
+    assert records[0]["Worker_Data"]["Worker_ID"] == "21001"
+    assert records[0]["Worker_Reference"]["ID"] == [
+        {"-type": "WID", "#content": "wid-0001"},
+        {"-type": "Employee_ID", "#content": "21001"},
+    ]
+
+
+def test_parse_response_snapshot_csv(workday_request, snapshot_report_csv):
+    response = MagicMock()
+    response.text = snapshot_report_csv
+    records = list(workday_request.parse_response(response, stream_name="base_snapshot_report"))
+    assert records[0] == {"Employee_ID": "21001", "First_Name": "Adam", "Last_Name": "Smith"}
+
+
+def test_parse_response_workers_is_lazy(workday_request, workers_response):
+    response = MagicMock()
+    response.content = workers_response.encode("utf-8")
+    parsed = workday_request.parse_response(response, stream_name="workers")
+    assert iter(parsed) is iter(parsed)  # generator, not a materialized list
+    assert len(list(parsed)) == 2
+
+
+def test_paged_body_is_rendered_once_per_invariants(workday_request):
+    WorkdayRequest._paged_body_parts.cache_clear()
+    first = workday_request.construct_paged_request_body(
+        file_name="workers.xml", tenant="acme", username="u", password="p", page=1, per_page=10
+    )
+    second = workday_request.construct_paged_request_body(
+        file_name="workers.xml", tenant="acme", username="u", password="p", page=7, per_page=10
+    )
+    info = WorkdayRequest._paged_body_parts.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert b"<wd:Page>1</wd:Page>" in first
+    assert b"<wd:Page>7</wd:Page>" in second
+
+
+def test_parse_records_captures_page_counters(workday_request, workers_response):
+    response = MagicMock()
+    response.content = workers_response.encode("utf-8")
+    list(workday_request.parse_response(response, stream_name="workers"))
+    assert response.workday_page_counters == {"Page": 1, "Total_Pages": 1}
+
+
+def test_worker_body_is_rendered_once_per_template(workday_request):
+    WorkdayRequest._worker_body_template.cache_clear()
+    first = workday_request.construct_worker_request_body(
+        file_name="worker_details_photo.xml", tenant="acme", username="u", password="p", page=1, per_page=200, worker_id="wid-0001"
+    )
+    second = workday_request.construct_worker_request_body(
+        file_name="worker_details_photo.xml", tenant="acme", username="u", password="p", page=1, per_page=200, worker_id="wid-0002"
+    )
+    assert '<wd:ID wd:type="WID">wid-0001</wd:ID>' in first
+    assert '<wd:ID wd:type="WID">wid-0002</wd:ID>' in second
+    info = WorkdayRequest._worker_body_template.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_worker_batch_body_lists_every_reference(workday_request):
+    body = workday_request.construct_worker_batch_request_body(
+        file_name="worker_details.xml",
+        tenant="acme",
+        username="u",
+        password="p",
+        page=1,
+        per_page=200,
+        worker_ids=("wid-0001", "wid-0002", "wid-0003"),
+    )
+    assert body.count("<wd:Worker_Reference>") == 3
+    assert '<wd:ID wd:type="WID">wid-0003</wd:ID>' in body